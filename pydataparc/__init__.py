@@ -1 +1,8 @@
 from .historian import Historian
+
+try:
+    from .async_historian import AsyncHistorian
+except ImportError:
+    # fastmssql is an optional dependency; the pymssql-based Historian
+    # remains available without it.
+    pass
@@ -0,0 +1,199 @@
+from datetime import datetime, timedelta
+import os
+from typing import Dict, Iterable, List
+
+from fastmssql import Connection
+
+from .historian import Tag, TagReading, _esc, _get_tz, _make_localize, _validate_range
+
+
+class AsyncHistorian:
+    def __init__(self, site_abbreviation: str = None, server: str = None, user: str = None, password: str = None,
+                 timezone: str = None, database: str = 'ctc_config'):
+        self.server = server if server is not None else os.environ['DATAPARC_SERVER']
+        self.user: str = user if user is not None else os.environ['DATAPARC_USERNAME']
+        self.password: str = password if password is not None else os.environ['DATAPARC_PASSWORD']
+        self.database: str = database
+        self.abbreviation = site_abbreviation if site_abbreviation is not None else os.environ['DATAPARC_SITE_ABBREVIATION']
+        self.timezone = _get_tz(timezone if timezone is not None else os.environ.get('DATAPARC_TIMEZONE', "UTC"))
+        self._localize = _make_localize(self.timezone)
+        # fastmssql lazily initializes its connection pool on first query, so
+        # constructing the Connection here costs nothing until it is used.
+        self.conn = Connection(f"Server={self.server};Database={self.database};"
+                               f"User Id={self.user};Password={self.password}")
+
+    async def get_all_tags(self) -> List[Tag]:
+        """
+        Retrieves a list of tag metadata for all of the defined tags in dataparc
+        :return: A list of all tags with metadata
+        """
+        result = await self.conn.query(" \
+            SELECT \
+                @P1 + '.' + ds.name +'.'+ t.sname [Id], \
+                t.lname [Description], \
+                t.units [Units] \
+            FROM ctc_tag t inner JOIN ctc_dssource ds on t.dssourceid = ds.dssourceid", [self.abbreviation])
+        return [Tag(r['Id'], r['Description'], r['Units']) for r in result.rows()]
+
+    async def get_current_tag_reading(self, tag_id: str, escape_slashes=True):
+        """
+        Retrieves the current raw reading, if any, for the specified tag_id
+        :param tag_id: The tag to retrieve
+        :param escape_slashes: specifies whether any '/' need to be replaced with '//'
+        :return: The current reading, if any, None otherwise
+        """
+        if escape_slashes:
+            tag_id = _esc(tag_id)
+
+        result = await self.conn.query(" \
+            SELECT REPLACE(tagname, '//', '/') [Id], \
+                   Timestamp [Timestamp], \
+                   value [Value], \
+                   quality [Quality] \
+            FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (@P1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1, ';')  \
+            WHERE  shistorianquality != 'NoBound'", [tag_id])
+        rows = result.rows()
+        if not rows:
+            return None
+        row = rows[-1]
+        return TagReading(row['Value'], self._localize(row['Timestamp']), row['Quality'])
+
+    async def get_current_tags_readings(self, tag_ids: Iterable[str], escape_slash=True) -> Dict[str, TagReading]:
+        """
+        A method that returns the current raw readings, if any, for each dataparc tag_id
+        :param tag_ids:  A list of Dataparc tag identifiers
+        :param escape_slash: specifies whether the / needs to be escaped for dataparc queries
+        :return: A dictionary containing the current reading for each tag, if any.
+        """
+        if escape_slash:
+            tag_ids = list(map(_esc, tag_ids))
+        result = await self.conn.query(" \
+            SELECT REPLACE(tagname, '//', '/') [Id], \
+               Timestamp [Timestamp], \
+               value [Value], \
+               quality [Quality] \
+            FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (@P1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1, ';')  \
+            WHERE  shistorianquality != 'NoBound'", [";".join(tag_ids)])
+        return {r['Id']: TagReading(r['Value'], self._localize(r['Timestamp']), r['Quality'])
+                for r in result.rows()}
+
+    async def get_tag_readings(self, tag_id: str, start_time: datetime, end_time: datetime, escape_slashes=True)\
+            -> List[TagReading]:
+        """
+        Retrieves all raw readings between start and end for the specified tag_id, sorted by timestamp ascending
+        :param tag_id: The Dataparc tag identifier
+        :param start_time: start of the requested time range
+        :param end_time: end of the requested time rang
+        :param escape_slashes: specifies whether the '/' needs to be replaced with '//'
+        :return: The TagReadings sorted chronologically
+        """
+        _validate_range(start_time, end_time)
+
+        if escape_slashes:
+            tag_id = _esc(tag_id)
+
+        result = await self.conn.query(" \
+            SELECT REPLACE(tagname, '//', '/') [Id], \
+               Timestamp [Timestamp], \
+               value [Value], \
+               quality [Quality] \
+            FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (@P1, @P2, @P3, 1, ';')  \
+            WHERE  shistorianquality != 'NoBound'",
+            [tag_id, self._localize(start_time), self._localize(end_time)])
+        return [TagReading(r['Value'], self._localize(r['Timestamp']), r['Quality']) for r in result.rows()]
+
+    async def get_tags_readings(self, tag_ids: Iterable[str], start_time: datetime, end_time: datetime, escape_slash=True)\
+            -> Dict[str, List[TagReading]]:
+        """
+        Retrieves all tag readings within the time range provided, sorted by timestamp ascending for each tag id
+
+        :param tag_ids: list of tag identifiers
+        :param start_time: start of requested time range
+        :param end_time: end of requested time range
+        :param escape_slash: whether a second '/' needs to be added for each '/'
+        :return: A dictionary containing the tag readings sorted in chronological order
+        """
+        _validate_range(start_time, end_time)
+
+        if escape_slash:
+            tag_ids = list(map(_esc, tag_ids))
+
+        result = await self.conn.query(" \
+            SELECT REPLACE(tagname, '//', '/') [Id], \
+               Timestamp [Timestamp], \
+               value [Value], \
+               quality [Quality] \
+            FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (@P1, @P2, @P3, 1, ';')  \
+            WHERE  shistorianquality != 'NoBound'",
+            [";".join(tag_ids), self._localize(start_time), self._localize(end_time)])
+        readings: Dict[str, List[TagReading]] = {}
+        for row in result.rows():
+            if row['Id'] not in readings:
+                readings[row['Id']] = [TagReading(row['Value'], self._localize(row['Timestamp']), row['Quality'])]
+            else:
+                readings[row['Id']].append(TagReading(row['Value'], self._localize(row['Timestamp']), row['Quality']))
+        return readings
+
+    async def get_tags_readings_interpolated(self, tag_ids: Iterable[str], start_time: datetime, end_time: datetime,
+                                             step_size=60, aggregate='AVERAGE', escape_slash=True, remove_microseconds=True)\
+            -> Dict[str, List[TagReading]]:
+        """
+        Retrieves all tag readings within the time range provided, sorted by timestamp ascending for each tag id
+
+        :param tag_ids: list of tag identifiers
+        :param start_time: start of requested time range
+        :param end_time: end of requested time range
+        :param escape_slash: whether a second '/' needs to be added for each '/'
+        :return: A dictionary containing the tag readings sorted in chronological order
+        """
+        _validate_range(start_time, end_time, allow_equal=False)
+
+        if escape_slash:
+            tag_ids = list(map(_esc, tag_ids))
+
+        result = await self.conn.query(" \
+            SELECT REPLACE(tagname, '//', '/') [Id], \
+               Timestamp [Timestamp], \
+               value [Value], \
+               quality [Quality] \
+            FROM   [dbo].[Ctc_fn_parcdata_readinterpolatedtags] (@P1, @P2, @P3, @P4, @P5, ';')  \
+            WHERE  shistorianquality != 'NoBound'",
+            [";".join(tag_ids), self._localize(start_time), self._localize(end_time), aggregate, step_size])
+        readings: Dict[str, List[TagReading]] = {}
+        for row in result.rows():
+            if row['Id'] not in readings:
+                readings[row['Id']] = [TagReading(row['Value'], self._localize(row['Timestamp'].replace(microsecond=0)), row['Quality'])]
+            else:
+                readings[row['Id']].append(TagReading(row['Value'], self._localize(row['Timestamp'].replace(microsecond=0)), row['Quality']))
+        return readings
+
+
+if __name__ == '__main__':
+    import asyncio
+    import time
+    from dotenv import load_dotenv
+    from statistics import stdev
+
+    async def main():
+        hist = AsyncHistorian()
+        start = datetime(2018, 9, 30) + timedelta(days=1)
+        days = await asyncio.gather(
+            *[hist.get_tags_readings_interpolated(["Example Tag 3", "Example Tag 4"],
+                                                  start + timedelta(days=i), start + timedelta(days=i + 1),
+                                                  step_size=1, aggregate="INTERPOLATIVE")
+              for i in range(30)])
+        for i, values in enumerate(days):
+            to_consider = []
+            bad_seconds = 0
+            for j in range(len(values["Example Tag 3"])):
+                if values["Example Tag 4"][j].value > 300.0:
+                    to_consider.append(values["Example Tag 3"][j].value)
+                else:
+                    bad_seconds += 1
+            print(f"{stdev(to_consider) if to_consider else 0.0} on {start + timedelta(days=i):%m/%d/%y} - ({bad_seconds} seconds excluded)")
+
+    load_dotenv()
+    start_time = time.time()
+    asyncio.run(main())
+    end_time = time.time()
+    print(f"{end_time - start_time} seconds.")
@@ -1,27 +1,152 @@
+import functools
+import threading
 import warnings
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
-from typing import Dict, Iterable, List
-import pytz
+from typing import Dict, Iterable, List, Tuple
+from zoneinfo import ZoneInfo
+import numpy as np
 
 with warnings.catch_warnings():
     warnings.filterwarnings("ignore",category=DeprecationWarning)
     import pymssql
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tz(name: str):
+    """
+    Looks up a timezone, caching the result so repeated Historian
+    construction does not re-read the zoneinfo database from disk. UTC (the
+    default) short-circuits to the fixed-offset stdlib singleton, skipping
+    the DST lookup machinery entirely.
+    :param name: an IANA timezone name
+    :return: the tzinfo object
+    """
+    return timezone.utc if name == 'UTC' else ZoneInfo(name)
+
+
+def _make_localize(tz):
+    """
+    Builds the function that attaches the configured timezone to the naive
+    timestamps coming back from the historian. Unlike pytz, standard tzinfo
+    objects support dt.replace(tzinfo=...) directly, which is a single
+    C-level call per row.
+    :param tz: the tzinfo to attach
+    :return: a function localizing a naive datetime
+    """
+    def localize(dt: datetime) -> datetime:
+        return dt.replace(tzinfo=tz)
+    return localize
+
+
+def _esc(s: str) -> str:
+    """
+    Escapes '/' as '//' for dataparc queries, skipping the copy entirely for
+    the common case of a tag id with no slash
+    :param s: a tag identifier
+    :return: the escaped identifier
+    """
+    return s.replace('/', '//') if '/' in s else s
+
+
+def _validate_range(start_time: datetime, end_time: datetime, allow_equal: bool = True) -> None:
+    """
+    Rejects degenerate time ranges before they cost a database roundtrip
+    :param start_time: start of the requested time range
+    :param end_time: end of the requested time range
+    :param allow_equal: whether an empty range (start == end) is acceptable
+    """
+    if start_time > end_time or (not allow_equal and start_time == end_time):
+        raise ValueError("A valid time range is required.")
+
+
+def _no_localize(ts: datetime) -> datetime:
+    """
+    Passthrough used when timestamps arrive from the server already tz-aware
+    :param ts: a tz-aware timestamp
+    :return: the timestamp unchanged
+    """
+    return ts
+
+
+def _id_column(escaped_tag_ids: Iterable[str]) -> str:
+    """
+    Picks the SQL expression for the returned tag id. The per-row
+    REPLACE(tagname, '//', '/') unescape is only paid when one of the
+    requested ids actually contains an escaped slash.
+    :param escaped_tag_ids: the tag ids after escaping
+    :return: the SQL column expression yielding the unescaped tag id
+    """
+    return "REPLACE(tagname, '//', '/')" if any('//' in t for t in escaped_tag_ids) else "tagname"
+
+
+_SQL_ALL_TAGS = """
+    SELECT %s + '.' + ds.name + '.' + t.sname [Id],
+           t.lname [Description],
+           t.units [Units]
+    FROM   ctc_tag t inner JOIN ctc_dssource ds on t.dssourceid = ds.dssourceid"""
+
+_SQL_CURRENT_READING = """
+    SELECT TOP 1 {id_column} [Id],
+           {ts_column} [Timestamp],
+           value [Value],
+           quality [Quality]
+    FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (%s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1, ';')
+    WHERE  shistorianquality != 'NoBound'
+    ORDER  BY Timestamp DESC"""
+
+_SQL_CURRENT_READINGS = """
+    SELECT {id_column} [Id],
+           {ts_column} [Timestamp],
+           value [Value],
+           quality [Quality]
+    FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (%s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1, ';')
+    WHERE  shistorianquality != 'NoBound'"""
+
+_SQL_RAW_READINGS = """
+    SELECT {id_column} [Id],
+           {ts_column} [Timestamp],
+           value [Value],
+           quality [Quality]
+    FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (%s, %s, %s, 1, ';')
+    WHERE  shistorianquality != 'NoBound'"""
+
+_SQL_INTERPOLATED_READINGS = """
+    SELECT {id_column} [Id],
+           {ts_column} [Timestamp],
+           value [Value],
+           quality [Quality]
+    FROM   [dbo].[Ctc_fn_parcdata_readinterpolatedtags] (%s, %s, %s, %s, %s, ';')
+    WHERE  shistorianquality != 'NoBound'"""
+
+_SQL_STDEV_FILTERED = """
+    SELECT STDEV(CASE WHEN g.value > %s THEN t.value END) [Stdev],
+           SUM(CASE WHEN g.value > %s THEN 0 ELSE 1 END) [Excluded]
+    FROM   [dbo].[Ctc_fn_parcdata_readinterpolatedtags] (%s, %s, %s, %s, %s, ';') t
+           JOIN [dbo].[Ctc_fn_parcdata_readinterpolatedtags] (%s, %s, %s, %s, %s, ';') g
+             ON t.Timestamp = g.Timestamp
+    WHERE  t.shistorianquality != 'NoBound'
+      AND  g.shistorianquality != 'NoBound'"""
+
 
 @dataclass
 class Tag:
+    __slots__ = ('id', 'description', 'units')
     id: str
     description: str
     units: str
 
 
-@dataclass
-class TagReading:
-    value: float
-    timestamp: datetime
-    quality: int
+class _TagReadingMethods:
+    __slots__ = ()
 
     def quality_str(self) -> str:
         """
@@ -38,35 +163,126 @@ class TagReading:
     def __str__(self):
         return f"{self.value:.2f} at {self.timestamp:%m/%d/%y %H:%M:%S %z} (S:{self.quality_str()})"
 
-    def __repr__(self):
-        return self.__str__()
+
+# __repr__ must be defined in each class body below: msgspec.Struct and
+# @dataclass both install their own __repr__, which would shadow one
+# inherited from the mixin.
+if msgspec is not None:
+    # msgspec.Struct has a C-level constructor and slotted layout, which
+    # matters for the millions of TagReadings built in the row loops.
+    class TagReading(msgspec.Struct, _TagReadingMethods):
+        value: float
+        timestamp: datetime
+        quality: int
+
+        def __repr__(self):
+            return self.__str__()
+else:
+    @dataclass(repr=False)
+    class TagReading(_TagReadingMethods):
+        __slots__ = ('value', 'timestamp', 'quality')
+        value: float
+        timestamp: datetime
+        quality: int
+
+        def __repr__(self):
+            return self.__str__()
 
 
 class Historian:
     def __init__(self, site_abbreviation: str = None, server: str = None, user: str = None, password: str = None,
-                 timezone: str = None, database: str = 'ctc_config'):
+                 timezone: str = None, database: str = 'ctc_config', server_side_tz: bool = False,
+                 max_workers: int = 8):
         self.server = server if server is not None else os.environ['DATAPARC_SERVER']
         self.user: str = user if user is not None else os.environ['DATAPARC_USERNAME']
         self.password: str = password if password is not None else os.environ['DATAPARC_PASSWORD']
         self.database: str = database
         self.abbreviation = site_abbreviation if site_abbreviation is not None else os.environ['DATAPARC_SITE_ABBREVIATION']
-        self.timezone = pytz.timezone(timezone) if timezone is not None else pytz.timezone(os.environ.get('DATAPARC_TIMEZONE', "UTC"))
+        self.tz_name = timezone if timezone is not None else os.environ.get('DATAPARC_TIMEZONE', "UTC")
+        self.timezone = _get_tz(self.tz_name)
+        # the localizer is called once per returned row, so build it once
+        # instead of re-resolving timezone attachment on every call.
+        self._localize = _make_localize(self.timezone)
+        self.server_side_tz = server_side_tz
+        if server_side_tz:
+            # MSSQL attaches the offset itself via AT TIME ZONE, so rows
+            # arrive already tz-aware and the per-row localize is skipped.
+            # The name must be one SQL Server recognizes ('UTC' is, IANA
+            # names generally are not); it comes from trusted configuration.
+            self._ts_column = "Timestamp AT TIME ZONE '{}'".format(self.tz_name.replace("'", "''"))
+            self._row_localize = _no_localize
+        else:
+            self._ts_column = "Timestamp"
+            self._row_localize = self._localize
+        self._local = threading.local()
+        self._conns: List = []
+        self._conn_lock = threading.Lock()
+        self._max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._interp_cache = OrderedDict()
+        self._interp_cache_size = 64
+        self._interp_cache_lock = threading.Lock()
+
+    def _connection(self):
+        """
+        Lazily opens one connection per thread on first use and reuses it for
+        every subsequent query from that thread, avoiding a TCP handshake and
+        TDS login per call while staying safe under concurrent callers.
+        :return: the calling thread's pymssql connection
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = pymssql.connect(self.server, self.user, self.password, self.database)
+            self._local.conn = conn
+            with self._conn_lock:
+                self._conns.append(conn)
+        return conn
+
+    def _get_executor(self):
+        """
+        Lazily creates the shared thread pool used for chunked and prefetch
+        queries. The pool lives as long as the historian, so worker threads
+        keep reusing their per-thread connections instead of leaking a new
+        connection per batch.
+        :return: the shared executor
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def close(self):
+        """
+        Shuts down the shared thread pool and closes any connections that
+        were opened. The historian can still be used afterwards; the pool and
+        connections are recreated on demand.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        with self._conn_lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def get_all_tags(self) -> List[Tag]:
         """
         Retrieves a list of tag metadata for all of the defined tags in dataparc
         :return: A list of all tags with metadata
         """
-        with pymssql.connect(self.server, self.user, self.password, self.database) as conn:
-            with conn.cursor(as_dict=True) as cursor:
-                cursor.execute(f" \
-                    SELECT \
-                        '{self.abbreviation}.' + ds.name +'.'+ t.sname [Id], \
-                        t.lname [Description], \
-                        t.units [Units] \
-                    FROM ctc_tag t inner JOIN ctc_dssource ds on t.dssourceid = ds.dssourceid")
-                results = cursor.fetchall()
-                return [Tag(r['Id'], r['Description'], r['Units']) for r in results]
+        with self._connection().cursor() as cursor:
+            cursor.execute(_SQL_ALL_TAGS, (self.abbreviation,))
+            return [Tag(r[0], r[1], r[2]) for r in cursor]
 
     def get_current_tag_reading(self, tag_id: str, escape_slashes=True):
         """
@@ -76,23 +292,16 @@ class Historian:
         :return: The current reading, if any, None otherwise
         """
         if escape_slashes:
-            tag_id = tag_id.replace('/', '//')
-
-        with pymssql.connect(self.server, self.user, self.password, self.database) as conn:
-            with conn.cursor(as_dict=True) as cursor:
-                cursor.execute(" \
-                    SELECT REPLACE(tagname, '//', '/') [Id], \
-                           Timestamp [Timestamp], \
-                           value [Value], \
-                           quality [Quality] \
-                    FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (%s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1, ';')  \
-                    WHERE  shistorianquality != 'NoBound'", tag_id)
-                results = cursor.fetchall()
-                if not results:
-                    return None
-                else:
-                    result = results[-1]
-                    return TagReading(result['Value'], self.timezone.localize(result['Timestamp']), result['Quality'])
+            tag_id = _esc(tag_id)
+
+        with self._connection().cursor() as cursor:
+            cursor.execute(_SQL_CURRENT_READING.format(id_column=_id_column([tag_id]),
+                                                       ts_column=self._ts_column), tag_id)
+            result = cursor.fetchone()
+            if result is None:
+                return None
+            _, ts, value, quality = result
+            return TagReading(value, self._row_localize(ts), quality)
 
     def get_current_tags_readings(self, tag_ids: Iterable[str], escape_slash=True) -> Dict[str, TagReading]:
         """
@@ -102,17 +311,13 @@ class Historian:
         :return: A dictionary containing the current reading for each tag, if any.
         """
         if escape_slash:
-            tag_ids = [s.replace('/', '//') for s in tag_ids]
-        with pymssql.connect(self.server, self.user, self.password, self.database) as conn:
-            with conn.cursor(as_dict=True) as cursor:
-                cursor.execute(" \
-                    SELECT REPLACE(tagname, '//', '/') [Id], \
-                       Timestamp [Timestamp], \
-                       value [Value], \
-                       quality [Quality] \
-                    FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (%s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1, ';')  \
-                    WHERE  shistorianquality != 'NoBound'", ";".join(tag_ids))
-                return {r['Id']: TagReading(r['Value'], self.timezone.localize(r['Timestamp']), r['Quality']) for r in cursor}
+            tag_ids = list(map(_esc, tag_ids))
+        with self._connection().cursor() as cursor:
+            cursor.execute(_SQL_CURRENT_READINGS.format(id_column=_id_column(tag_ids),
+                                                        ts_column=self._ts_column), ";".join(tag_ids))
+            loc = self._row_localize
+            reading = TagReading
+            return {rid: reading(value, loc(ts), quality) for rid, ts, value, quality in cursor}
 
     def get_tag_readings(self, tag_id: str, start_time: datetime, end_time: datetime, escape_slashes=True)\
             -> List[TagReading]:
@@ -124,24 +329,19 @@ class Historian:
         :param escape_slashes: specifies whether the '/' needs to be replaced with '//'
         :return: The TagReadings sorted chronologically
         """
-        if not start_time <= end_time:
-            raise ValueError("A valid time range is required.")
+        _validate_range(start_time, end_time)
 
         if escape_slashes:
-            tag_id = tag_id.replace('/', '//')
-
-        with pymssql.connect(self.server, self.user, self.password, self.database) as conn:
-            with conn.cursor(as_dict=True) as cursor:
-                cursor.execute(" \
-                    SELECT REPLACE(tagname, '//', '/') [Id], \
-                       Timestamp [Timestamp], \
-                       value [Value], \
-                       quality [Quality] \
-                    FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (%s, %s, %s, 1, ';')  \
-                    WHERE  shistorianquality != 'NoBound'",
-                               (tag_id, self.timezone.localize(start_time), self.timezone.localize(end_time)))
-                results = [TagReading(r['Value'], self.timezone.localize(r['Timestamp']), r['Quality']) for r in cursor]
-                return results
+            tag_id = _esc(tag_id)
+
+        with self._connection().cursor() as cursor:
+            cursor.execute(_SQL_RAW_READINGS.format(id_column=_id_column([tag_id]),
+                                                    ts_column=self._ts_column),
+                           (tag_id, self._localize(start_time), self._localize(end_time)))
+            loc = self._row_localize
+            reading = TagReading
+            results = [reading(value, loc(ts), quality) for _, ts, value, quality in cursor]
+            return results
 
     def get_tags_readings(self, tag_ids: Iterable[str], start_time: datetime, end_time: datetime, escape_slash=True)\
             -> Dict[str, List[TagReading]]:
@@ -154,31 +354,28 @@ class Historian:
         :param escape_slash: whether a second '/' needs to be added for each '/'
         :return: A dictionary containing the tag readings sorted in chronological order
         """
+        _validate_range(start_time, end_time)
+
         if escape_slash:
-            tag_ids = [s.replace('/', '//') for s in tag_ids]
-
-        with pymssql.connect(self.server, self.user, self.password, self.database) as conn:
-            with conn.cursor(as_dict=True) as cursor:
-                cursor.execute(" \
-                    SELECT REPLACE(tagname, '//', '/') [Id], \
-                       Timestamp [Timestamp], \
-                       value [Value], \
-                       quality [Quality] \
-                    FROM   [dbo].[Ctc_fn_parcdata_readrawtags] (%s, %s, %s, 1, ';')  \
-                    WHERE  shistorianquality != 'NoBound'", (";".join(tag_ids), self.timezone.localize(start_time), self.timezone.localize(end_time)))
-                results = cursor.fetchall()
-                result: Dict[str, List[TagReading]] = {}
-                for row in results:
-                    if row['Id'] not in result:
-                        result[row['Id']] = [TagReading(row['Value'], self.timezone.localize(row['Timestamp']), row['Quality'])]
-                    else:
-                        result[row['Id']].append(TagReading(row['Value'], self.timezone.localize(row['Timestamp']), row['Quality']))
-                return result
+            tag_ids = list(map(_esc, tag_ids))
+
+        with self._connection().cursor() as cursor:
+            cursor.execute(_SQL_RAW_READINGS.format(id_column=_id_column(tag_ids),
+                                                    ts_column=self._ts_column),
+                           (";".join(tag_ids), self._localize(start_time), self._localize(end_time)))
+            loc = self._row_localize
+            reading = TagReading
+            result: Dict[str, List[TagReading]] = defaultdict(list)
+            for rid, ts, value, quality in cursor:
+                result[rid].append(reading(value, loc(ts), quality))
+            return dict(result)
 
     def get_tags_readings_interpolated(self, tag_ids: Iterable[str], start_time: datetime, end_time: datetime, step_size=60, aggregate='AVERAGE', escape_slash=True, remove_microseconds=True)\
             -> Dict[str, List[TagReading]]:
         """
-        Retrieves all tag readings within the time range provided, sorted by timestamp ascending for each tag id
+        Retrieves all tag readings within the time range provided, sorted by timestamp ascending for each tag id.
+        Results are memoized in a small LRU cache so repeated or windowed
+        access over the same range skips the database roundtrip.
 
         :param tag_ids: list of tag identifiers
         :param start_time: start of requested time range
@@ -186,52 +383,230 @@ class Historian:
         :param escape_slash: whether a second '/' needs to be added for each '/'
         :return: A dictionary containing the tag readings sorted in chronological order
         """
+        _validate_range(start_time, end_time, allow_equal=False)
+
+        tag_ids = list(tag_ids)
+        key = (tuple(sorted(tag_ids)), start_time.isoformat(), end_time.isoformat(),
+               step_size, aggregate, escape_slash)
+        with self._interp_cache_lock:
+            if key in self._interp_cache:
+                self._interp_cache.move_to_end(key)
+                return self._interp_cache[key]
+
+        result = self._fetch_tags_readings_interpolated(tag_ids, start_time, end_time, step_size,
+                                                        aggregate, escape_slash)
+        with self._interp_cache_lock:
+            self._interp_cache[key] = result
+            while len(self._interp_cache) > self._interp_cache_size:
+                self._interp_cache.popitem(last=False)
+        return result
+
+    def prefetch_tags_readings_interpolated(self, tag_ids: Iterable[str], start_time: datetime, end_time: datetime,
+                                            step_size=60, aggregate='AVERAGE', escape_slash=True) -> None:
+        """
+        Warms the interpolated-readings cache for an upcoming window on the
+        shared thread pool, so sequential day-by-day access can overlap the
+        next fetch with processing of the current one
+        """
+        tag_ids = list(tag_ids)
+        self._get_executor().submit(self.get_tags_readings_interpolated, tag_ids, start_time, end_time,
+                                    step_size, aggregate, escape_slash)
+
+    def clear_cache(self) -> None:
+        """
+        Drops any cached interpolated readings
+        """
+        with self._interp_cache_lock:
+            self._interp_cache.clear()
+
+    def _fetch_tags_readings_interpolated(self, tag_ids, start_time, end_time, step_size, aggregate, escape_slash)\
+            -> Dict[str, List[TagReading]]:
+        original_ids = list(tag_ids)
+        tag_ids = list(map(_esc, original_ids)) if escape_slash else original_ids
+
+        # The row count per tag is predictable from the step size, so the
+        # per-tag lists are preallocated and filled by index instead of grown
+        # by repeated appends.
+        n_expected = int((end_time - start_time).total_seconds() // step_size) + 1 if step_size > 0 else 0
+
+        with self._connection().cursor() as cursor:
+            cursor.execute(_SQL_INTERPOLATED_READINGS.format(id_column=_id_column(tag_ids),
+                                                             ts_column=self._ts_column),
+                           (";".join(tag_ids), self._localize(start_time), self._localize(end_time), aggregate, step_size))
+            loc = self._row_localize
+            reading = TagReading
+            result = {tid: [None] * n_expected for tid in original_ids}
+            counts = dict.fromkeys(original_ids, 0)
+            for rid, ts, value, quality in cursor:
+                if ts.microsecond:
+                    ts = ts.replace(microsecond=0)
+                bucket = result.get(rid)
+                if bucket is None:
+                    result[rid] = bucket = []
+                    counts[rid] = 0
+                i = counts[rid]
+                if i < len(bucket):
+                    bucket[i] = reading(value, loc(ts), quality)
+                else:
+                    bucket.append(reading(value, loc(ts), quality))
+                counts[rid] = i + 1
+            # trim unused capacity; tags without rows stay absent as before
+            return {tid: bucket[:counts[tid]] for tid, bucket in result.items() if counts[tid]}
+
+    def get_stdev_filtered(self, target_tag: str, guard_tag: str, guard_threshold: float,
+                           start_time: datetime, end_time: datetime, step_size=60, aggregate='AVERAGE',
+                           escape_slash=True) -> Tuple[float, int]:
+        """
+        Computes the standard deviation of target_tag server-side over the
+        interpolated samples where guard_tag exceeds guard_threshold, so only
+        two scalars cross the wire instead of every sample in the range
+
+        :param target_tag: the tag whose values are aggregated
+        :param guard_tag: the tag gating which samples count
+        :param guard_threshold: samples where guard_tag is at or below this are excluded
+        :param start_time: start of requested time range
+        :param end_time: end of requested time range
+        :param step_size: interpolation step in seconds
+        :param aggregate: the dataparc aggregate to apply per step
+        :param escape_slash: whether a second '/' needs to be added for each '/'
+        :return: the standard deviation (0.0 if fewer than two samples qualify)
+            and the number of excluded samples
+        """
+        _validate_range(start_time, end_time, allow_equal=False)
+
+        if escape_slash:
+            target_tag = _esc(target_tag)
+            guard_tag = _esc(guard_tag)
+
+        start = self._localize(start_time)
+        end = self._localize(end_time)
+        with self._connection().cursor() as cursor:
+            cursor.execute(_SQL_STDEV_FILTERED,
+                           (guard_threshold, guard_threshold,
+                            target_tag, start, end, aggregate, step_size,
+                            guard_tag, start, end, aggregate, step_size))
+            stdev_value, excluded = cursor.fetchone()
+            return (stdev_value if stdev_value is not None else 0.0, excluded or 0)
+
+    def get_tags_readings_interpolated_arrays(self, tag_ids: Iterable[str], start_time: datetime,
+                                              end_time: datetime, step_size=60, aggregate='AVERAGE',
+                                              escape_slash=True) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Retrieves interpolated readings as parallel NumPy arrays per tag
+        (structure-of-arrays) rather than TagReading objects, so analytics can
+        filter and aggregate with vectorized operations instead of per-element
+        Python loops. Timestamps are naive datetime64 values expressed in the
+        historian's configured timezone.
+
+        :param tag_ids: list of tag identifiers
+        :param start_time: start of requested time range
+        :param end_time: end of requested time range
+        :param step_size: interpolation step in seconds
+        :param aggregate: the dataparc aggregate to apply per step
+        :param escape_slash: whether a second '/' needs to be added for each '/'
+        :return: A dictionary mapping each tag id to arrays keyed 'value'
+            (float64), 'timestamp' (datetime64[ns]), and 'quality' (int16),
+            sorted chronologically
+        """
+        _validate_range(start_time, end_time, allow_equal=False)
+
         if escape_slash:
-            tag_ids = [s.replace('/', '//') for s in tag_ids]
-
-        with pymssql.connect(self.server, self.user, self.password, self.database) as conn:
-            with conn.cursor(as_dict=True) as cursor:
-                cursor.execute(" \
-                    SELECT REPLACE(tagname, '//', '/') [Id], \
-                       Timestamp [Timestamp], \
-                       value [Value], \
-                       quality [Quality] \
-                    FROM   [dbo].[Ctc_fn_parcdata_readinterpolatedtags] (%s, %s, %s, %s, %s, ';')  \
-                    WHERE  shistorianquality != 'NoBound'", (";".join(tag_ids), self.timezone.localize(start_time), self.timezone.localize(end_time), aggregate, step_size))
-                results = cursor.fetchall()
-                result = {}
-                for row in results:
-                    if row['Id'] not in result:
-                        result[row['Id']] = [TagReading(row['Value'], self.timezone.localize(row['Timestamp'].replace(microsecond=0)), row['Quality'])]
-                    else:
-                        result[row['Id']].append(TagReading(row['Value'], self.timezone.localize(row['Timestamp'].replace(microsecond=0)), row['Quality']))
-                return result
+            tag_ids = list(map(_esc, tag_ids))
+
+        with self._connection().cursor() as cursor:
+            cursor.execute(_SQL_INTERPOLATED_READINGS.format(id_column=_id_column(tag_ids),
+                                                             ts_column="Timestamp"),
+                           (";".join(tag_ids), self._localize(start_time), self._localize(end_time), aggregate, step_size))
+            values = defaultdict(list)
+            timestamps = defaultdict(list)
+            qualities = defaultdict(list)
+            for tag_id, ts, value, quality in cursor:
+                if ts.microsecond:
+                    ts = ts.replace(microsecond=0)
+                values[tag_id].append(value)
+                timestamps[tag_id].append(ts)
+                qualities[tag_id].append(quality)
+            return {tag_id: {'value': np.fromiter(values[tag_id], dtype=np.float64, count=len(values[tag_id])),
+                             'timestamp': np.array(timestamps[tag_id], dtype='datetime64[ns]'),
+                             'quality': np.fromiter(qualities[tag_id], dtype=np.int16, count=len(qualities[tag_id]))}
+                    for tag_id in values}
+
+    def get_tags_readings_interpolated_multiday(self, tag_ids: Iterable[str], start_time: datetime,
+                                                end_time: datetime, step_size=60, aggregate='AVERAGE',
+                                                escape_slash=True, chunk_days: int = None)\
+            -> Dict[str, List[TagReading]]:
+        """
+        Retrieves interpolated readings for a long time range in a single query
+        (or a few chunked queries) instead of one query per day, avoiding the
+        per-roundtrip overhead of many small requests. Chunked queries run
+        concurrently on the historian's shared thread pool, each worker
+        thread reusing its own connection.
+
+        :param tag_ids: list of tag identifiers
+        :param start_time: start of requested time range
+        :param end_time: end of requested time range
+        :param step_size: interpolation step in seconds
+        :param aggregate: the dataparc aggregate to apply per step
+        :param escape_slash: whether a second '/' needs to be added for each '/'
+        :param chunk_days: if set, split the range into chunks of this many days
+            to cap the per-query row count
+        :return: A dictionary containing the tag readings sorted in chronological order
+        """
+        _validate_range(start_time, end_time, allow_equal=False)
+        if chunk_days is None:
+            return self.get_tags_readings_interpolated(tag_ids, start_time, end_time, step_size=step_size,
+                                                       aggregate=aggregate, escape_slash=escape_slash)
+
+        tag_ids = list(tag_ids)
+        chunks = []
+        chunk_start = start_time
+        while chunk_start < end_time:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days), end_time)
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end
+
+        def fetch_chunk(chunk):
+            return self.get_tags_readings_interpolated(tag_ids, chunk[0], chunk[1], step_size=step_size,
+                                                       aggregate=aggregate, escape_slash=escape_slash)
+
+        merged: Dict[str, List[TagReading]] = defaultdict(list)
+        # executor.map yields results in submission order, so the merged lists
+        # stay chronological even when chunks complete out of order.
+        for chunk_result in self._get_executor().map(fetch_chunk, chunks):
+            for tag_id, readings in chunk_result.items():
+                merged_readings = merged[tag_id]
+                # The interpolated range is endpoint-inclusive, so adjacent
+                # chunks both return the sample at their shared boundary;
+                # skip it the second time around.
+                if merged_readings and readings and readings[0].timestamp == merged_readings[-1].timestamp:
+                    readings = readings[1:]
+                merged_readings.extend(readings)
+        return dict(merged)
 
 
 if __name__ == '__main__':
     import time
     from dotenv import load_dotenv
     import pandas as pd
-    from statistics import stdev
     load_dotenv()
     start_time = time.time()
     hist = Historian()
     current_value = hist.get_current_tags_readings(["Example Tag 1", "Example Tag 2"])
     start = datetime(2018, 9, 30) + timedelta(days=1)
-    start2 = datetime()
-    end = datetime(2018, 7, 19)
+    values = hist.get_tags_readings_interpolated_arrays(["Example Tag 3", "Example Tag 4"],
+                                                        start, start + timedelta(days=30),
+                                                        step_size=1, aggregate="INTERPOLATIVE")
+    v3 = values["Example Tag 3"]["value"]
+    v4 = values["Example Tag 4"]["value"]
+    good = v4 > 300.0
+    days = values["Example Tag 3"]["timestamp"].astype('datetime64[D]')
     for i in range(30):
-        start_date = start + timedelta(days=i)
-        end_date = start_date + timedelta(days=1)
-        values = hist.get_tags_readings_interpolated(["Example Tag 3", "Example Tag 4"], start_date, end_date, step_size=1, aggregate="INTERPOLATIVE")
-        to_consider = []
-        bad_seconds = 0
-        for i in range(len(values["Example Tag 3"])):
-            if values["Example Tag 4"][i].value > 300.0:
-                to_consider.append(values["Example Tag 3"][i].value)
-            else:
-                bad_seconds += 1
-        print(f"{stdev(to_consider) if to_consider else 0.0} on {start_date:%m/%d/%y} - ({bad_seconds} seconds excluded)")
+        day = start + timedelta(days=i)
+        day_mask = days == np.datetime64(day.date())
+        day_values = v3[good & day_mask]
+        day_stdev = float(np.std(day_values, ddof=1)) if day_values.size > 1 else 0.0
+        bad_seconds = int(day_mask.sum() - (good & day_mask).sum())
+        print(f"{day_stdev} on {day:%m/%d/%y} - ({bad_seconds} seconds excluded)")
     
     # bad_times = {x.timestamp: True for x in list(filter(lambda x: x.value < 300, values["Example Tag 4"]))}
     # print(len(bad_times.keys()), " bad seconds")
@@ -0,0 +1,41 @@
+from datetime import datetime
+from unittest import IsolatedAsyncioTestCase, mock, skipUnless
+
+try:
+    from ..async_historian import AsyncHistorian
+except ImportError:
+    AsyncHistorian = None
+
+from ..historian import Tag, TagReading
+
+
+@skipUnless(AsyncHistorian, "fastmssql is not installed")
+class TestAsyncHistorian(IsolatedAsyncioTestCase):
+    @mock.patch('pydataparc.async_historian.Connection')
+    async def test_historian_returns_tags(self, mock_connection):
+        result = mock.Mock()
+        result.rows.return_value = [{"Id": "test1", "Description": "Test Description", "Units": "gal"}]
+        mock_connection.return_value.query = mock.AsyncMock(return_value=result)
+        sut = AsyncHistorian('', '', '', '')
+        tags = await sut.get_all_tags()
+        assert len(tags) == 1
+        self.assertIsInstance(tags[0], Tag)
+
+    @mock.patch('pydataparc.async_historian.Connection')
+    async def test_returns_current_value(self, mock_connection):
+        result = mock.Mock()
+        result.rows.return_value = [{"Id": "test1", "Timestamp": datetime.now(), "Value": 1.0, "Quality": 194}]
+        mock_connection.return_value.query = mock.AsyncMock(return_value=result)
+        sut = AsyncHistorian('', '', '', '')
+        reading = await sut.get_current_tag_reading('test1')
+        self.assertIsInstance(reading, TagReading)
+        self.assertAlmostEqual(reading.value, 1.0, 2)
+
+    @mock.patch('pydataparc.async_historian.Connection')
+    async def test_handles_no_current_value(self, mock_connection):
+        result = mock.Mock()
+        result.rows.return_value = []
+        mock_connection.return_value.query = mock.AsyncMock(return_value=result)
+        sut = AsyncHistorian('', '', '', '')
+        reading = await sut.get_current_tag_reading('test1')
+        assert not reading
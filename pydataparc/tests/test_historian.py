@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest import TestCase, mock
 from ..historian import Historian, Tag, TagReading
 
@@ -11,8 +11,8 @@ class TestHistorian(TestCase):
 
     @mock.patch('pymssql.connect')
     def test_historian_returns_tags(self, mock_connect):
-        mock_connect.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value.fetchall \
-            .return_value = [{"Id": "test1", "Description": "Test Description", "Units": "gal"}]
+        mock_connect.return_value.cursor.return_value.__enter__.return_value.__iter__ \
+            .return_value = iter([("test1", "Test Description", "gal")])
         sut = Historian('', '', '', '')
         result = sut.get_all_tags()
         assert len(result) == 1
@@ -20,17 +20,112 @@ class TestHistorian(TestCase):
 
     @mock.patch('pymssql.connect')
     def test_returns_current_value(self, mock_connect):
-        mock_connect.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value.fetchall \
-            .return_value = [{"Id": "test1", "Timestamp": datetime.now(), "Value": 1.0, "Quality": 194}]
+        mock_connect.return_value.cursor.return_value.__enter__.return_value.fetchone \
+            .return_value = ("test1", datetime.now(), 1.0, 194)
         sut = Historian('', '', '', '')
         result = sut.get_current_tag_reading('test1')
         self.assertIsInstance(result, TagReading)
         self.assertAlmostEqual(result.value, 1.0, 2)
 
+    def test_tag_reading_repr(self):
+        reading = TagReading(1.0, datetime(2018, 10, 1, tzinfo=timezone.utc), 192)
+        assert repr(reading) == "1.00 at 10/01/18 00:00:00 +0000 (S:Good)"
+        assert repr(reading) == str(reading)
+
+    @mock.patch('pymssql.connect')
+    def test_reuses_connection_across_calls(self, mock_connect):
+        mock_connect.return_value.cursor.return_value.__enter__.return_value.__iter__ \
+            .return_value = iter([])
+        with Historian('', '', '', '') as sut:
+            sut.get_all_tags()
+            sut.get_all_tags()
+        assert mock_connect.call_count == 1
+        mock_connect.return_value.close.assert_called_once()
+
+    def test_multiday_chunks_and_merges(self):
+        sut = Historian('', '', '', '')
+        start = datetime(2018, 10, 1)
+        # The reading at the 7-day mark sits on the chunk boundary, so both
+        # chunks return it; the merged list must contain it only once.
+        readings = [TagReading(1.0, start, 192), TagReading(2.0, start + timedelta(days=7), 192),
+                    TagReading(3.0, start + timedelta(days=14), 192)]
+        with mock.patch.object(sut, 'get_tags_readings_interpolated') as mock_get:
+            mock_get.side_effect = lambda tag_ids, chunk_start, chunk_end, *args, **kwargs: \
+                {"test1": [r for r in readings if chunk_start <= r.timestamp <= chunk_end]}
+            result = sut.get_tags_readings_interpolated_multiday(["test1"], start, start + timedelta(days=14),
+                                                                 chunk_days=7)
+        assert mock_get.call_count == 2
+        assert result["test1"] == readings
+
+    @mock.patch('pymssql.connect')
+    def test_caches_interpolated_readings(self, mock_connect):
+        cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+        cursor.__iter__.side_effect = lambda: iter([("test1", datetime(2018, 10, 1), 1.0, 192)])
+        sut = Historian('', '', '', '')
+        first = sut.get_tags_readings_interpolated(["test1"], datetime(2018, 10, 1), datetime(2018, 10, 2))
+        second = sut.get_tags_readings_interpolated(["test1"], datetime(2018, 10, 1), datetime(2018, 10, 2))
+        assert first is second
+        assert cursor.execute.call_count == 1
+        sut.clear_cache()
+        sut.get_tags_readings_interpolated(["test1"], datetime(2018, 10, 1), datetime(2018, 10, 2))
+        assert cursor.execute.call_count == 2
+
+    @mock.patch('pymssql.connect')
+    def test_returns_interpolated_arrays(self, mock_connect):
+        mock_connect.return_value.cursor.return_value.__enter__.return_value.__iter__ \
+            .return_value = iter([("test1", datetime(2018, 10, 1), 1.0, 192),
+                                  ("test1", datetime(2018, 10, 1, 0, 1), 2.0, 192)])
+        sut = Historian('', '', '', '')
+        result = sut.get_tags_readings_interpolated_arrays(["test1"], datetime(2018, 10, 1), datetime(2018, 10, 2))
+        assert list(result["test1"]["value"]) == [1.0, 2.0]
+        assert result["test1"]["value"].dtype == 'float64'
+        assert result["test1"]["timestamp"].dtype == 'datetime64[ns]'
+        assert list(result["test1"]["quality"]) == [192, 192]
+
+    @mock.patch('pymssql.connect')
+    def test_server_side_tz_skips_localize(self, mock_connect):
+        aware = datetime.now(timezone.utc)
+        cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = ("test1", aware, 1.0, 192)
+        sut = Historian('', '', '', '', server_side_tz=True)
+        result = sut.get_current_tag_reading('test1')
+        assert result.timestamp is aware
+        assert "AT TIME ZONE 'UTC'" in cursor.execute.call_args[0][0]
+
+    @mock.patch('pymssql.connect')
+    def test_computes_filtered_stdev_server_side(self, mock_connect):
+        cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (2.5, 17)
+        sut = Historian('', '', '', '')
+        result = sut.get_stdev_filtered('test1', 'guard1', 300.0,
+                                        datetime(2018, 10, 1), datetime(2018, 10, 2), step_size=1)
+        assert result == (2.5, 17)
+
+    @mock.patch('pymssql.connect')
+    def test_filtered_stdev_handles_no_samples(self, mock_connect):
+        cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (None, None)
+        sut = Historian('', '', '', '')
+        result = sut.get_stdev_filtered('test1', 'guard1', 300.0,
+                                        datetime(2018, 10, 1), datetime(2018, 10, 2))
+        assert result == (0.0, 0)
+
+    def test_rejects_invalid_time_ranges(self):
+        sut = Historian('', '', '', '')
+        start = datetime(2018, 10, 2)
+        with self.assertRaises(ValueError):
+            sut.get_tag_readings('test1', start, start - timedelta(days=1))
+        with self.assertRaises(ValueError):
+            sut.get_tags_readings(["test1"], start, start - timedelta(days=1))
+        with self.assertRaises(ValueError):
+            sut.get_tags_readings_interpolated(["test1"], start, start)
+        with self.assertRaises(ValueError):
+            sut.get_tags_readings_interpolated_multiday(["test1"], start, start, chunk_days=7)
+
     @mock.patch('pymssql.connect')
     def test_handles_no_current_value(self, mock_connect):
-        mock_connect.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value.fetchall \
-            .return_value = []
+        mock_connect.return_value.cursor.return_value.__enter__.return_value.fetchone \
+            .return_value = None
         sut = Historian('', '', '', '')
         result = sut.get_current_tag_reading('test1')
         assert not result